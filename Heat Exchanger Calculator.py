@@ -1,131 +1,110 @@
-import streamlit as st
-import math
-import matplotlib.pyplot as plt
-import numpy as np
-
-st.set_page_config(page_title="Heat Exchanger Calculator", layout="centered")
-st.title("Heat Exchanger Input Calculator")
-st.markdown("""
-This tool calculates heat duty, log mean temperature difference (LMTD), and required heat exchanger area.
-Supports counter-flow and parallel-flow exchangers.
-""")
-
-st.header("Input Parameters")
-col1, col2 = st.columns(2)
-
-# Hot Fluid Section
-with col1:
-    st.subheader("Hot Fluid")
-    m_dot_hot = st.number_input("Hot mass flow rate (kg/s)", min_value=0.0, value=1.0)
-    Cp_hot = st.number_input("Hot specific heat (kJ/kg·K)", min_value=0.0, value=4.18)
-    T_hot_in = st.number_input("Hot inlet temperature (°C)", value=80.0)
-    T_hot_out_known = st.checkbox("Input hot outlet temperature?", value=True)
-    T_hot_out = st.number_input("Hot outlet temperature (°C)", value=50.0) if T_hot_out_known else None
-
-# Cold Fluid Section
-with col2:
-    st.subheader("Cold Fluid")
-    m_dot_cold = st.number_input("Cold mass flow rate (kg/s)", min_value=0.0, value=1.0)
-    Cp_cold = st.number_input("Cold specific heat (kJ/kg·K)", min_value=0.0, value=4.18)
-    T_cold_in = st.number_input("Cold inlet temperature (°C)", value=20.0)
-    T_cold_out_known = st.checkbox("Input cold outlet temperature?", value=False)
-    T_cold_out = st.number_input("Cold outlet temperature (°C)", value=45.0) if T_cold_out_known else None
-
-U = st.number_input("Overall heat transfer coefficient U (W/m²·K)", min_value=1.0, value=500.0)
-flow_type = st.selectbox("Flow configuration", ["Counter-flow", "Parallel-flow"])
-
-# Calculation
-Q = None
-T_hot_out_calc = T_cold_out_calc = None
-
-if T_hot_out_known and T_cold_out_known:
-    Q_hot = m_dot_hot * Cp_hot * (T_hot_in - T_hot_out) * 1000
-    Q_cold = m_dot_cold * Cp_cold * (T_cold_out - T_cold_in) * 1000
-    Q = min(Q_hot, Q_cold)
-elif T_hot_out_known:
-    Q = m_dot_hot * Cp_hot * (T_hot_in - T_hot_out) * 1000
-    T_cold_out_calc = T_cold_in + Q / (m_dot_cold * Cp_cold * 1000)
-elif T_cold_out_known:
-    Q = m_dot_cold * Cp_cold * (T_cold_out - T_cold_in) * 1000
-    T_hot_out_calc = T_hot_in - Q / (m_dot_hot * Cp_hot * 1000)
-else:
-    st.warning("Please provide at least three temperatures to perform the calculation.")
-
-if Q is not None:
-    if T_hot_out is None:
-        T_hot_out = T_hot_out_calc
-        st.info(f"Calculated hot outlet temperature: {T_hot_out:.2f} °C")
-    if T_cold_out is None:
-        T_cold_out = T_cold_out_calc
-        st.info(f"Calculated cold outlet temperature: {T_cold_out:.2f} °C")
-
-    # Validation
-    valid = True
-    if T_hot_out >= T_hot_in:
-        st.error("Hot outlet temperature must be less than inlet temperature.")
-        valid = False
-    if T_cold_out <= T_cold_in:
-        st.error("Cold outlet temperature must be greater than inlet temperature.")
-        valid = False
-
-    if valid:
-        Q_hot = m_dot_hot * Cp_hot * (T_hot_in - T_hot_out) * 1000
-        Q_cold = m_dot_cold * Cp_cold * (T_cold_out - T_cold_in) * 1000
-        Q = min(Q_hot, Q_cold)
-
-        if flow_type == "Counter-flow":
-            delta_T1 = T_hot_in - T_cold_out
-            delta_T2 = T_hot_out - T_cold_in
-        else:
-            delta_T1 = T_hot_in - T_cold_in
-            delta_T2 = T_hot_out - T_cold_out
-
-        if delta_T1 <= 0 or delta_T2 <= 0:
-            LMTD = float('nan')
-            st.error("Temperature differences for LMTD are invalid (<= 0).")
-        elif delta_T1 == delta_T2:
-            LMTD = delta_T1
-        else:
-            try:
-                LMTD = (delta_T1 - delta_T2) / math.log(delta_T1 / delta_T2)
-            except:
-                LMTD = float('nan')
-                st.error("LMTD calculation failed.")
-
-        A = Q / (U * LMTD) if U > 0 and not math.isnan(LMTD) else float('nan')
-
-        st.header("Results")
-        st.metric("Heat Duty (Q)", f"{Q / 1000:.2f} kW")
-        st.metric("LMTD", f"{LMTD:.2f} °C")
-        st.metric("Required Area", f"{A:.2f} m²")
-
-        # Temperature profile
-        st.subheader("Temperature Profile")
-        x = np.linspace(0, 1, 100)
-        if flow_type == "Counter-flow":
-            T_hot = T_hot_in - (T_hot_in - T_hot_out) * x
-            T_cold = T_cold_out - (T_cold_out - T_cold_in) * (1 - x)
-        else:
-            T_hot = T_hot_in - (T_hot_in - T_hot_out) * x
-            T_cold = T_cold_in + (T_cold_out - T_cold_in) * x
-
-        fig, ax = plt.subplots()
-        ax.plot(x, T_hot, label="Hot Fluid", linewidth=2)
-        ax.plot(x, T_cold, label="Cold Fluid", linewidth=2, linestyle='--')
-        ax.set_xlabel("Heat Exchanger Length (normalized)")
-        ax.set_ylabel("Temperature (°C)")
-        ax.set_title(f"{flow_type} Temperature Profile")
-        ax.grid(True, linestyle='--', alpha=0.6)
-        ax.legend()
-        st.pyplot(fig)
-
-with st.expander("Assumptions Used"):
-    st.markdown("""
-    - Fluids are well mixed and properties (Cp, density) are constant.
-    - No phase change occurs in either stream.
-    - Heat losses to the environment are negligible.
-    - Flow is steady-state and one-dimensional.
-    - Linear temperature gradients are assumed for visualization.
-    """)
-
-st.caption("Built by Renuja Perera with Streamlit")
+import streamlit as st
+import math
+
+from hx_core import compute, profile_x
+
+st.set_page_config(page_title="Heat Exchanger Calculator", layout="centered")
+st.title("Heat Exchanger Input Calculator")
+st.markdown("""
+This tool calculates heat duty, log mean temperature difference (LMTD), and required heat exchanger area.
+Supports counter-flow and parallel-flow exchangers.
+""")
+
+st.header("Input Parameters")
+
+# The form batches all widget edits into a single rerun on submit, so the
+# calculation and plot below run once per "Calculate" instead of per keystroke.
+with st.form("hx_inputs"):
+    col1, col2 = st.columns(2)
+
+    # Hot Fluid Section
+    with col1:
+        st.subheader("Hot Fluid")
+        m_dot_hot = st.number_input("Hot mass flow rate (kg/s)", min_value=0.0, value=1.0)
+        Cp_hot = st.number_input("Hot specific heat (kJ/kg·K)", min_value=0.0, value=4.18)
+        T_hot_in = st.number_input("Hot inlet temperature (°C)", value=80.0)
+        T_hot_out_known = st.checkbox("Input hot outlet temperature?", value=True)
+        T_hot_out = st.number_input("Hot outlet temperature (°C)", value=50.0) if T_hot_out_known else None
+
+    # Cold Fluid Section
+    with col2:
+        st.subheader("Cold Fluid")
+        m_dot_cold = st.number_input("Cold mass flow rate (kg/s)", min_value=0.0, value=1.0)
+        Cp_cold = st.number_input("Cold specific heat (kJ/kg·K)", min_value=0.0, value=4.18)
+        T_cold_in = st.number_input("Cold inlet temperature (°C)", value=20.0)
+        T_cold_out_known = st.checkbox("Input cold outlet temperature?", value=False)
+        T_cold_out = st.number_input("Cold outlet temperature (°C)", value=45.0) if T_cold_out_known else None
+
+    U = st.number_input("Overall heat transfer coefficient U (W/m²·K)", min_value=1.0, value=500.0)
+    flow_type = st.selectbox("Flow configuration", ["Counter-flow", "Parallel-flow"])
+    submitted = st.form_submit_button("Calculate")
+
+if submitted:
+    # Calculation
+    Q = None
+    T_hot_out_calc = T_cold_out_calc = None
+
+    if T_hot_out_known and T_cold_out_known:
+        Q_hot = m_dot_hot * Cp_hot * (T_hot_in - T_hot_out) * 1000
+        Q_cold = m_dot_cold * Cp_cold * (T_cold_out - T_cold_in) * 1000
+        Q = min(Q_hot, Q_cold)
+    elif T_hot_out_known:
+        Q = m_dot_hot * Cp_hot * (T_hot_in - T_hot_out) * 1000
+        T_cold_out_calc = T_cold_in + Q / (m_dot_cold * Cp_cold * 1000)
+    elif T_cold_out_known:
+        Q = m_dot_cold * Cp_cold * (T_cold_out - T_cold_in) * 1000
+        T_hot_out_calc = T_hot_in - Q / (m_dot_hot * Cp_hot * 1000)
+    else:
+        st.warning("Please provide at least three temperatures to perform the calculation.")
+
+    if Q is not None:
+        if T_hot_out is None:
+            T_hot_out = T_hot_out_calc
+            st.info("Calculated hot outlet temperature: %.2f °C" % T_hot_out)
+        if T_cold_out is None:
+            T_cold_out = T_cold_out_calc
+            st.info("Calculated cold outlet temperature: %.2f °C" % T_cold_out)
+
+        # Validation
+        valid = True
+        if T_hot_out >= T_hot_in:
+            st.error("Hot outlet temperature must be less than inlet temperature.")
+            valid = False
+        if T_cold_out <= T_cold_in:
+            st.error("Cold outlet temperature must be greater than inlet temperature.")
+            valid = False
+
+        if valid:
+            result = compute(Q, T_hot_in, T_hot_out, T_cold_in, T_cold_out, U, flow_type)
+            LMTD, A = result.LMTD, result.A
+
+            if math.isnan(LMTD):
+                st.error("Temperature differences for LMTD are invalid (<= 0).")
+
+            st.header("Results")
+            res1, res2, res3 = st.columns(3)
+            res1.metric("Heat Duty (Q)", "%.2f kW" % (Q / 1000))
+            res2.metric("LMTD", "%.2f °C" % LMTD)
+            res3.metric("Required Area", "%.2f m²" % A)
+
+            # Temperature profile; Vega-Lite renders client-side, so the
+            # server only ships a few KB of JSON instead of a PNG.
+            st.subheader(f"{flow_type} Temperature Profile")
+            import pandas as pd
+            x, _ = profile_x()
+            profile = pd.DataFrame({"Hot Fluid": result.T_hot, "Cold Fluid": result.T_cold},
+                                   index=x)
+            st.line_chart(profile,
+                          x_label="Heat Exchanger Length (normalized)",
+                          y_label="Temperature (°C)")
+
+with st.expander("Assumptions Used"):
+    st.markdown("""
+    - Fluids are well mixed and properties (Cp, density) are constant.
+    - No phase change occurs in either stream.
+    - Heat losses to the environment are negligible.
+    - Flow is steady-state and one-dimensional.
+    - Linear temperature gradients are assumed for visualization.
+    """)
+
+st.caption("Built by Renuja Perera with Streamlit")
@@ -0,0 +1,126 @@
+"""Numeric core for the heat exchanger calculator.
+
+Keeps the cached LMTD/area kernel and temperature-profile helpers in
+one module so any UI script can reuse them; numpy and numba are
+imported lazily so importers only pay for what they touch.
+"""
+
+import streamlit as st
+import math
+from collections import namedtuple
+
+HXResult = namedtuple("HXResult", ["Q", "LMTD", "A", "T_hot", "T_cold"])
+
+# Flow configurations as integer codes, resolved once per compute() call so
+# the kernels branch on a plain bool instead of repeated string compares.
+_COUNTER = 0
+_PARALLEL = 1
+_FLOW = {"Counter-flow": _COUNTER, "Parallel-flow": _PARALLEL}
+
+
+@st.cache_resource
+def profile_x():
+    """Shared abscissa for the temperature profile; immutable, built once."""
+    import numpy as np
+    # float32 is plenty for a 100-point line plot and halves the bytes
+    # pushed through the rendering path.
+    x = np.linspace(0.0, 1.0, 100, dtype=np.float32)
+    return x, np.float32(1.0) - x
+
+
+@st.cache_resource
+def _get_kernel():
+    """Scalar LMTD/area kernel, JIT-compiled when numba is available.
+
+    The kernel is branch-only arithmetic, so it lifts directly to
+    numba for batched parameter sweeps; without numba the plain
+    Python function is returned unchanged.
+    """
+    def kernel(Q, T_hot_in, T_hot_out, T_cold_in, T_cold_out, U, counter):
+        if counter:
+            delta_T1 = T_hot_in - T_cold_out
+            delta_T2 = T_hot_out - T_cold_in
+        else:
+            delta_T1 = T_hot_in - T_cold_in
+            delta_T2 = T_hot_out - T_cold_out
+
+        if delta_T1 <= 0.0 or delta_T2 <= 0.0:
+            return math.nan, math.nan
+        if delta_T1 == delta_T2:
+            LMTD = delta_T1
+        else:
+            # log1p form stays accurate when delta_T1 and delta_T2 are close.
+            d = delta_T1 - delta_T2
+            LMTD = d / math.log1p(d / delta_T2)
+
+        # One reciprocal plus a multiply; in a batched sweep this turns
+        # N divides into one divide and N multiplies.
+        if U > 0.0:
+            inv_UL = 1.0 / (U * LMTD)
+            A = Q * inv_UL
+        else:
+            A = math.nan
+        return LMTD, A
+
+    try:
+        from numba import njit
+        kernel = njit(cache=True, fastmath=True)(kernel)
+    except ImportError:
+        pass
+    return kernel
+
+
+@st.cache_resource
+def _get_profile_fill():
+    """Temperature-profile filler for a preallocated (2, n) array.
+
+    Both profiles are a +/- b*c per point, so the numba loop compiles
+    to fused multiply-adds under fastmath; without numba the numpy
+    broadcast form is used instead.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        def fill(T_hot_in, T_hot_out, T_cold_in, T_cold_out, x, one_minus_x, counter, T):
+            T[0] = T_hot_in - (T_hot_in - T_hot_out) * x
+            if counter:
+                T[1] = T_cold_out - (T_cold_out - T_cold_in) * one_minus_x
+            else:
+                T[1] = T_cold_in + (T_cold_out - T_cold_in) * x
+        return fill
+
+    @njit(cache=True, fastmath=True)
+    def fill(T_hot_in, T_hot_out, T_cold_in, T_cold_out, x, one_minus_x, counter, T):
+        d_hot = T_hot_in - T_hot_out
+        d_cold = T_cold_out - T_cold_in
+        for i in range(x.size):
+            T[0, i] = T_hot_in - d_hot * x[i]
+            if counter:
+                T[1, i] = T_cold_out - d_cold * one_minus_x[i]
+            else:
+                T[1, i] = T_cold_in + d_cold * x[i]
+    return fill
+
+
+@st.cache_data(max_entries=128)
+def compute(Q, T_hot_in, T_hot_out, T_cold_in, T_cold_out, U, flow_type):
+    """Pure-numeric core, cached so identical inputs skip recomputation on reruns.
+
+    Q is resolved by the caller's heat balance, so it is taken as given
+    here rather than recomputed from the flow rates.
+    """
+    import numpy as np
+
+    counter = _FLOW[flow_type] == _COUNTER
+
+    # The kernel guards its own divisors (returns NaN for non-physical
+    # delta-Ts), so no exception handling is needed around the call.
+    LMTD, A = _get_kernel()(Q, T_hot_in, T_hot_out, T_cold_in, T_cold_out,
+                            U, counter)
+
+    x, one_minus_x = profile_x()
+    T = np.empty((2, 100), dtype=np.float32)
+    _get_profile_fill()(T_hot_in, T_hot_out, T_cold_in, T_cold_out,
+                        x, one_minus_x, counter, T)
+
+    return HXResult(Q, LMTD, A, T[0], T[1])